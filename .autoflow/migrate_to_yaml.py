@@ -2,103 +2,293 @@
 """
 Migrate auto-flow Markdown files to YAML format.
 """
+import argparse
+import json
+import os
 import re
+import sys
 import yaml
+from dataclasses import dataclass
+from itertools import takewhile
 from pathlib import Path
+from typing import ClassVar
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-def parse_sprints_md():
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_YAML_OPTIONS = {'Dumper': _Dumper, 'encoding': 'utf-8', 'default_flow_style': False, 'sort_keys': False, 'allow_unicode': True}
+_WRITE_BUFFER_SIZE = 1 << 18
+# Worker start-up (and, on spawn platforms, re-importing yaml) costs more than
+# parsing the usual few hundred KB of Markdown, so only fan out above this
+_PARALLEL_MIN_BYTES = 1 << 22
+
+# Field value patterns
+_WORD_RE = re.compile(r'\w+')
+_TASK_ID_RE = re.compile(r'task-\d+')
+
+# SPRINTS.md patterns
+_PROJECT_RE = re.compile(r'\*\*Project\*\*:\s*(.+)')
+_TOTAL_SPRINTS_RE = re.compile(r'\*\*Total Sprints\*\*:\s*(\d+)')
+_PROGRESS_VALUE_RE = re.compile(r'(\d+)/(\d+)')
+_SPRINT_FIELDS = {'**Duration': 'duration', '**Status': 'status', '**Progress': 'progress'}
+_DELIV_RE = re.compile(r'### Deliverables\n\n((?:\d+\..*\n)+)')
+_TASK_LINE_RE = re.compile(r'`(task-\d+)`\s*\[(\w+)\]\s*-\s*(.+)')
+
+# TASK.md patterns
+_CURRENT_SPRINT_RE = re.compile(r'\*\*Current Sprint\*\*:\s*Sprint (\d+)\s*-\s*(.+)')
+_SPRINT_GOAL_RE = re.compile(r'\*\*Sprint Goal\*\*:\s*(.+)')
+_DURATION_RE = re.compile(r'\*\*Duration\*\*:\s*(.+)')
+_STATUS_RE = re.compile(r'\*\*Status\*\*:\s*(\w+)')
+_PROGRESS_RE = re.compile(r'\*\*Progress\*\*:\s*(\d+)/(\d+)')
+_TASK_FIELDS = {
+    '**ID': 'id',
+    '**Priority': 'priority',
+    '**Status': 'status',
+    '**Estimated Effort': 'estimated',
+    '**Blockers': 'blockers',
+}
+_CRITERIA_RE = re.compile(r'\*\*Acceptance Criteria\*\*:\n((?:- \[.\] .+\n)+)')
+_DOCS_RE = re.compile(r'- \[(.+?)\]\((.+?)\)')
+
+# COMPLETED_TASKS.md patterns
+_COMPLETED_FIELDS = {
+    '**ID': 'id',
+    '**Status': 'status',
+    '**Completed': 'completed',
+    '**Estimated': 'estimated',
+    '**Actual': 'actual',
+    '**Sprint': 'sprint',
+}
+_COMMIT_RE = re.compile(r'\*\*Commit\*\*:\s*([a-f0-9]+)')
+_TESTS_RE = re.compile(r'Tests passing:\s*(.+)')
+_COVERAGE_RE = re.compile(r'Code coverage:\s*(.+)')
+
+@dataclass(slots=True)
+class SprintTask:
+    """A task line listed under a sprint in SPRINTS.md."""
+    id: str
+    status: str
+    title: str
+
+@dataclass(slots=True)
+class Sprint:
+    """A sprint section from SPRINTS.md."""
+    OPTIONAL: ClassVar[tuple] = ('completed',)
+
+    id: int
+    goal: str
+    status: str
+    duration: str
+    progress: dict
+    deliverables: list
+    tasks: list
+    completed: str | None = None
+
+@dataclass(slots=True)
+class Task:
+    """A task section from TASK.md."""
+    id: str
+    title: str
+    priority: str
+    status: str
+    estimated: str
+    description: str
+    acceptance_criteria: list
+    blockers: str | None
+    documentation: list
+
+@dataclass(slots=True)
+class CompletedTask:
+    """A task section from COMPLETED_TASKS.md."""
+    id: str
+    title: str
+    status: str
+    completed: str
+    estimated: str
+    actual: str
+    sprint: str
+    description: str
+    deliverables: list
+    commit: str | None
+    quality_metrics: dict
+
+def _record_items(record):
+    """Yield (field, value) pairs in declaration order, skipping unset optional fields."""
+    optional = getattr(record, 'OPTIONAL', ())
+    for field in record.__slots__:
+        value = getattr(record, field)
+        if value is None and field in optional:
+            continue
+        yield field, value
+
+def _represent_record(dumper, record):
+    """Represent a record as a YAML mapping in field order."""
+    return dumper.represent_dict(_record_items(record))
+
+_RECORD_TYPES = (SprintTask, Sprint, Task, CompletedTask)
+for _record_type in _RECORD_TYPES:
+    yaml.add_representer(_record_type, _represent_record, Dumper=_Dumper)
+
+def _json_default(obj):
+    """Serialize records for the JSON writer."""
+    if isinstance(obj, _RECORD_TYPES):
+        return dict(_record_items(obj))
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _section_bounds(text, prefix):
+    """Return (start, end) offsets of each section whose first line starts with prefix."""
+    starts = [0] if text.startswith(prefix) else []
+    marker = '\n' + prefix
+    pos = text.find(marker)
+    while pos >= 0:
+        starts.append(pos + 1)
+        pos = text.find(marker, pos + 1)
+    starts.append(len(text))
+    return zip(starts, starts[1:])
+
+def _read_fields(lines, table):
+    """Collect `**Label**: value` lines named in table; the first occurrence of a field wins.
+
+    A label with nothing after it takes the next non-blank line as its value.
+    """
+    fields = {}
+    for i, line in enumerate(lines):
+        label, _, value = line.partition('**:')
+        name = table.get(label)
+        if name and name not in fields:
+            value = value.strip()
+            if not value:
+                value = next((rest.strip() for rest in lines[i + 1:] if rest.strip()), '')
+            fields[name] = value
+    return fields
+
+def _first_word(value):
+    """Return the first word of a field value, e.g. 'HIGH' from '🔴 HIGH (blocked)'.
+
+    Values without any word characters are returned unchanged.
+    """
+    match = _WORD_RE.search(value)
+    return match.group() if match else value
+
+def _between(text, start, end):
+    """Return the stripped text between start and the next end, or '' if either is missing."""
+    i = text.find(start)
+    if i < 0:
+        return ''
+    i += len(start)
+    j = text.find(end, i)
+    return text[i:j].strip() if j >= 0 else ''
+
+def _dump_yaml(data, path):
+    """Write data to path as block-style UTF-8 YAML, keeping insertion order."""
+    with open(path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        yaml.dump(data, f, **_YAML_OPTIONS)
+
+def _dump_json(data, path):
+    """Write data to path as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_PASSTHROUGH_DATACLASS
+        payload = orjson.dumps(data, default=_json_default, option=options)
+    else:
+        payload = (json.dumps(data, default=_json_default, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+    Path(path).write_bytes(payload)
+
+def parse_sprints_md(last_updated):
     """Parse SPRINTS.md and extract structured data."""
-    sprints_md = Path('.autoflow/SPRINTS.md').read_text()
+    sprints_md = Path('.autoflow/SPRINTS.md').read_text(encoding='utf-8')
 
     # Extract project info
-    project_match = re.search(r'\*\*Project\*\*:\s*(.+)', sprints_md)
-    total_sprints_match = re.search(r'\*\*Total Sprints\*\*:\s*(\d+)', sprints_md)
+    project_match = _PROJECT_RE.search(sprints_md)
+    total_sprints_match = _TOTAL_SPRINTS_RE.search(sprints_md)
 
     project_name = project_match.group(1) if project_match else "CraftyPrep - Laser Engraving Image Prep Tool"
     total_sprints = int(total_sprints_match.group(1)) if total_sprints_match else 7
 
     # Parse sprints
     sprints = []
-    sprint_pattern = r'## Sprint (\d+):\s*(.+?)\n\n\*\*Duration\*\*:\s*(.+?)\n\*\*Status\*\*:\s*(\w+)\n\*\*Progress\*\*:\s*(\d+)/(\d+)'
-
-    for match in re.finditer(sprint_pattern, sprints_md):
-        sprint_id = int(match.group(1))
-        goal = match.group(2).strip()
-        duration = match.group(3).strip()
-        status = match.group(4).strip()
-        completed_tasks = int(match.group(5))
-        total_tasks = int(match.group(6))
-
-        # Find the sprint section
-        sprint_section_start = match.start()
-        next_sprint = re.search(r'## Sprint \d+:', sprints_md[match.end():])
-        sprint_section_end = match.end() + next_sprint.start() if next_sprint else len(sprints_md)
-        sprint_content = sprints_md[sprint_section_start:sprint_section_end]
+    for sprint_start, sprint_end in _section_bounds(sprints_md, '## Sprint '):
+        sprint_content = sprints_md[sprint_start:sprint_end]
+        section = sprint_content.splitlines()
+        fields = _read_fields(section, _SPRINT_FIELDS)
+        number, _, goal = section[0][len('## Sprint '):].partition(':')
+        progress_match = _PROGRESS_VALUE_RE.match(fields.get('progress', ''))
+        if not number.isdecimal() or not progress_match:
+            continue
+
+        sprint_id = int(number)
+        goal = goal.strip()
+        duration = fields.get('duration', '')
+        status = sys.intern(_first_word(fields.get('status', '')))
+        completed_tasks = int(progress_match.group(1))
+        total_tasks = int(progress_match.group(2))
 
         # Extract deliverables
         deliverables = []
-        deliverables_match = re.search(r'### Deliverables\n\n((?:\d+\..*\n)+)', sprint_content)
+        deliverables_match = _DELIV_RE.search(sprint_content)
         if deliverables_match:
             deliverables_text = deliverables_match.group(1)
-            deliverables = [line.strip()[3:].strip() for line in deliverables_text.split('\n') if line.strip()]
+            deliverables = [line.partition('.')[2].strip() for line in deliverables_text.splitlines() if line.strip()]
 
         # Extract tasks
         tasks = []
-        task_pattern = r'`(task-\d+)`\s*\[(\w+)\]\s*-\s*(.+)'
-        for task_match in re.finditer(task_pattern, sprint_content):
+        for task_match in _TASK_LINE_RE.finditer(sprint_content):
             task_id = task_match.group(1)
-            task_status = task_match.group(2)
+            task_status = sys.intern(task_match.group(2))
             task_title = task_match.group(3).strip()
 
-            tasks.append({
-                'id': task_id,
-                'status': task_status,
-                'title': task_title
-            })
+            tasks.append(SprintTask(id=task_id, status=task_status, title=task_title))
 
-        sprint_data = {
-            'id': sprint_id,
-            'goal': goal,
-            'status': status,
-            'duration': duration,
-            'progress': {
+        sprint = Sprint(
+            id=sprint_id,
+            goal=goal,
+            status=status,
+            duration=duration,
+            progress={
                 'completed': completed_tasks,
                 'total': total_tasks
             },
-            'deliverables': deliverables,
-            'tasks': tasks
-        }
+            deliverables=deliverables,
+            tasks=tasks
+        )
 
         # Add completed date for COMPLETE sprints
         if status == 'COMPLETE':
-            sprint_data['completed'] = '2025-10-04'  # Based on completed tasks
+            sprint.completed = '2025-10-04'  # Based on completed tasks
 
-        sprints.append(sprint_data)
+        sprints.append(sprint)
 
     # Determine current sprint
-    current_sprint = next((s['id'] for s in sprints if s['status'] == 'ACTIVE'), 1)
+    current_sprint = next((s.id for s in sprints if s.status == 'ACTIVE'), 1)
 
     return {
         'project': {
             'name': project_name,
             'total_sprints': total_sprints,
             'current_sprint': current_sprint,
-            'last_updated': datetime.now().strftime('%Y-%m-%d')
+            'last_updated': last_updated
         },
         'sprints': sprints
     }
 
-def parse_task_md():
+def parse_task_md(last_updated):
     """Parse TASK.md and extract structured data."""
-    task_md = Path('.autoflow/TASK.md').read_text()
+    task_md = Path('.autoflow/TASK.md').read_text(encoding='utf-8')
 
     # Extract sprint info
-    sprint_match = re.search(r'\*\*Current Sprint\*\*:\s*Sprint (\d+)\s*-\s*(.+)', task_md)
-    goal_match = re.search(r'\*\*Sprint Goal\*\*:\s*(.+)', task_md)
-    duration_match = re.search(r'\*\*Duration\*\*:\s*(.+)', task_md)
-    status_match = re.search(r'\*\*Status\*\*:\s*(\w+)', task_md)
-    progress_match = re.search(r'\*\*Progress\*\*:\s*(\d+)/(\d+)', task_md)
+    sprint_match = _CURRENT_SPRINT_RE.search(task_md)
+    goal_match = _SPRINT_GOAL_RE.search(task_md)
+    duration_match = _DURATION_RE.search(task_md)
+    status_match = _STATUS_RE.search(task_md)
+    progress_match = _PROGRESS_RE.search(task_md)
 
     sprint_id = int(sprint_match.group(1)) if sprint_match else 3
     sprint_name = sprint_match.group(2).strip() if sprint_match else "Material Presets & Settings"
@@ -110,65 +300,57 @@ def parse_task_md():
 
     # Parse tasks
     tasks = []
-    task_pattern = r'### (Task \d+\.\d+):\s*(.+?)\n\n\*\*ID\*\*:\s*(task-\d+)\n\*\*Priority\*\*:\s*(\w+)\n\*\*Status\*\*:\s*(\w+)\n\*\*Estimated Effort\*\*:\s*(.+)'
-
-    for match in re.finditer(task_pattern, task_md, re.MULTILINE):
-        task_name = match.group(1)
-        task_title = match.group(2).strip()
-        task_id = match.group(3)
-        priority = match.group(4).strip()
-        status_str = match.group(5).strip()
-        estimated = match.group(6).strip()
-
-        # Find task section
-        task_start = match.start()
-        next_task = re.search(r'### Task \d+\.\d+:', task_md[match.end():])
-        task_end = match.end() + next_task.start() if next_task else len(task_md)
+    for task_start, task_end in _section_bounds(task_md, '### Task '):
         task_section = task_md[task_start:task_end]
+        section = task_section.splitlines()
+        fields = _read_fields(section, _TASK_FIELDS)
+        id_match = _TASK_ID_RE.match(fields.get('id', ''))
+        if not id_match:
+            continue
+
+        task_title = section[0].partition(':')[2].strip()
+        task_id = id_match.group()
+        priority = sys.intern(_first_word(fields.get('priority', '')))
+        status_str = sys.intern(_first_word(fields.get('status', '')))
+        estimated = fields.get('estimated', '')
 
         # Extract description
-        desc_match = re.search(r'\*\*Description\*\*:\n(.+?)(?=\n\n\*\*)', task_section, re.DOTALL)
-        description = desc_match.group(1).strip() if desc_match else ""
+        description = _between(task_section, '**Description**:\n', '\n\n**')
 
         # Extract acceptance criteria
         criteria = []
-        criteria_section = re.search(r'\*\*Acceptance Criteria\*\*:\n((?:- \[.\] .+\n)+)', task_section)
+        criteria_section = _CRITERIA_RE.search(task_section)
         if criteria_section:
-            for line in criteria_section.group(1).split('\n'):
-                if line.strip().startswith('- ['):
-                    checked = 'x' in line[:6]
-                    criterion = line.split('] ', 1)[1].strip() if '] ' in line else line
+            for line in criteria_section.group(1).splitlines():
+                criterion = line.partition('] ')[2]
+                if criterion:
                     criteria.append({
-                        'criterion': criterion,
-                        'completed': checked
+                        'criterion': criterion.strip(),
+                        'completed': line[3:4] == 'x'
                     })
 
         # Extract blockers
-        blockers_match = re.search(r'\*\*Blockers\*\*:\s*(.+)', task_section)
-        blockers = blockers_match.group(1).strip() if blockers_match else "None"
+        blockers = fields.get('blockers') or "None"
 
         # Extract docs
         docs = []
-        docs_pattern = r'- \[(.+?)\]\((.+?)\)'
-        for doc_match in re.finditer(docs_pattern, task_section):
+        for doc_match in _DOCS_RE.finditer(task_section):
             docs.append({
                 'title': doc_match.group(1),
                 'path': doc_match.group(2)
             })
 
-        task_data = {
-            'id': task_id,
-            'title': task_title,
-            'priority': priority,
-            'status': status_str,
-            'estimated': estimated,
-            'description': description,
-            'acceptance_criteria': criteria,
-            'blockers': blockers if blockers != "None" else None,
-            'documentation': docs if docs else []
-        }
-
-        tasks.append(task_data)
+        tasks.append(Task(
+            id=task_id,
+            title=task_title,
+            priority=priority,
+            status=status_str,
+            estimated=estimated,
+            description=description,
+            acceptance_criteria=criteria,
+            blockers=blockers if blockers != "None" else None,
+            documentation=docs
+        ))
 
     return {
         'sprint': {
@@ -180,52 +362,53 @@ def parse_task_md():
                 'completed': completed,
                 'total': total
             },
-            'last_updated': datetime.now().isoformat() + 'Z'
+            'last_updated': last_updated
         },
         'tasks': tasks
     }
 
-def parse_completed_tasks_md():
+def parse_completed_tasks_md(last_updated):
     """Parse COMPLETED_TASKS.md and extract structured data."""
-    completed_md = Path('.autoflow/COMPLETED_TASKS.md').read_text()
+    completed_md = Path('.autoflow/COMPLETED_TASKS.md').read_text(encoding='utf-8')
 
     tasks = []
 
     # Parse completed tasks
-    task_pattern = r'### Task \d+\.\d+:\s*(.+?)\n\n\*\*ID\*\*:\s*(task-\d+)\n\*\*Status\*\*:\s*(\w+)\n\*\*Completed\*\*:\s*(.+?)\n\*\*Estimated\*\*:\s*(.+?)\n\*\*Actual\*\*:\s*(.+?)\n\*\*Sprint\*\*:\s*(.+)'
-
-    for match in re.finditer(task_pattern, completed_md, re.MULTILINE):
-        title = match.group(1).strip()
-        task_id = match.group(2)
-        status = match.group(3).strip()
-        completed_date = match.group(4).strip()
-        estimated = match.group(5).strip()
-        actual = match.group(6).strip()
-        sprint = match.group(7).strip()
-
-        # Find task section
-        task_start = match.start()
-        next_task = re.search(r'### Task \d+\.\d+:', completed_md[match.end():])
-        task_end = match.end() + next_task.start() if next_task else len(completed_md)
+    for task_start, task_end in _section_bounds(completed_md, '### Task '):
         task_section = completed_md[task_start:task_end]
+        section = task_section.splitlines()
+        fields = _read_fields(section, _COMPLETED_FIELDS)
+        id_match = _TASK_ID_RE.match(fields.get('id', ''))
+        if not id_match:
+            continue
+
+        title = section[0].partition(':')[2].strip()
+        task_id = id_match.group()
+        status = sys.intern(_first_word(fields.get('status', '')))
+        completed_date = fields.get('completed', '')
+        estimated = fields.get('estimated', '')
+        actual = fields.get('actual', '')
+        sprint = sys.intern(fields.get('sprint', ''))
 
         # Extract description
-        desc_match = re.search(r'\*\*Description\*\*:\n(.+?)(?=\n\n\*\*)', task_section, re.DOTALL)
-        description = desc_match.group(1).strip() if desc_match else ""
+        description = _between(task_section, '**Description**:\n', '\n\n**')
 
         # Extract deliverables
-        deliverables = []
-        deliv_match = re.search(r'\*\*Key Deliverables\*\*:\n((?:- ✅ .+\n)+)', task_section)
-        if deliv_match:
-            deliverables = [line.strip()[4:].strip() for line in deliv_match.group(1).split('\n') if line.strip()]
+        try:
+            deliverables_start = section.index('**Key Deliverables**:') + 1
+        except ValueError:
+            deliverables = []
+        else:
+            bullets = takewhile(lambda line: line.startswith('- '), section[deliverables_start:])
+            deliverables = [line[2:].lstrip('✅ ').strip() for line in bullets]
 
         # Extract commit hash
-        commit_match = re.search(r'\*\*Commit\*\*:\s*([a-f0-9]+)', task_section)
+        commit_match = _COMMIT_RE.search(task_section)
         commit = commit_match.group(1) if commit_match else None
 
         # Extract quality metrics
-        tests_match = re.search(r'Tests passing:\s*(.+)', task_section)
-        coverage_match = re.search(r'Code coverage:\s*(.+)', task_section)
+        tests_match = _TESTS_RE.search(task_section)
+        coverage_match = _COVERAGE_RE.search(task_section)
 
         quality_metrics = {}
         if tests_match:
@@ -233,63 +416,107 @@ def parse_completed_tasks_md():
         if coverage_match:
             quality_metrics['code_coverage'] = coverage_match.group(1).strip()
 
-        task_data = {
-            'id': task_id,
-            'title': title,
-            'status': status,
-            'completed': completed_date,
-            'estimated': estimated,
-            'actual': actual,
-            'sprint': sprint,
-            'description': description,
-            'deliverables': deliverables,
-            'commit': commit,
-            'quality_metrics': quality_metrics if quality_metrics else {}
-        }
-
-        tasks.append(task_data)
+        tasks.append(CompletedTask(
+            id=task_id,
+            title=title,
+            status=status,
+            completed=completed_date,
+            estimated=estimated,
+            actual=actual,
+            sprint=sprint,
+            description=description,
+            deliverables=deliverables,
+            commit=commit,
+            quality_metrics=quality_metrics
+        ))
 
     return {
         'project': {
             'name': 'CraftyPrep - Laser Engraving Image Prep Tool',
-            'last_updated': datetime.now().isoformat() + 'Z'
+            'last_updated': last_updated
         },
         'tasks': tasks
     }
 
-def main():
-    """Main migration function."""
-    print("🔄 Migrating auto-flow files from Markdown to YAML...\n")
+def _up_to_date(source, targets):
+    """Return True when every target is newer than both source and this script."""
+    try:
+        newest_input = max(os.stat(source).st_mtime_ns, os.stat(__file__).st_mtime_ns)
+        return all(newest_input <= os.stat(target).st_mtime_ns for target in targets)
+    except OSError:
+        return False
+
+def _outputs(name, write_json):
+    """Return the output file names for a migration."""
+    return [f'{name}.yml', f'{name}.json'] if write_json else [f'{name}.yml']
 
-    # Migrate SPRINTS.md to SPRINTS.yml
-    print("1. Migrating SPRINTS.md to SPRINTS.yml...")
+def _migrate(name, parse, last_updated, write_json):
+    """Migrate .autoflow/<name>.md to its output files and return a status line."""
     try:
-        sprints_data = parse_sprints_md()
-        with open('.autoflow/SPRINTS.yml', 'w') as f:
-            yaml.dump(sprints_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
-        print("   ✅ SPRINTS.yml created successfully\n")
+        data = parse(last_updated)
+        _dump_yaml(data, f'.autoflow/{name}.yml')
+        if write_json:
+            _dump_json(data, f'.autoflow/{name}.json')
+        return f"   ✅ {', '.join(_outputs(name, write_json))} created successfully\n"
     except Exception as e:
-        print(f"   ❌ Error: {e}\n")
+        return f"   ❌ Error: {e}\n"
 
-    # Migrate TASK.md to TASK.yml
-    print("2. Migrating TASK.md to TASK.yml...")
+def _source_size(name):
+    """Return the size of .autoflow/<name>.md in bytes, or 0 if it is missing."""
     try:
-        task_data = parse_task_md()
-        with open('.autoflow/TASK.yml', 'w') as f:
-            yaml.dump(task_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
-        print("   ✅ TASK.yml created successfully\n")
-    except Exception as e:
-        print(f"   ❌ Error: {e}\n")
+        return os.stat(f'.autoflow/{name}.md').st_size
+    except OSError:
+        return 0
 
-    # Migrate COMPLETED_TASKS.md to COMPLETED_TASKS.yml
-    print("3. Migrating COMPLETED_TASKS.md to COMPLETED_TASKS.yml...")
+def _result(future):
+    """Return a worker's status line, reporting a crashed worker as an error."""
     try:
-        completed_data = parse_completed_tasks_md()
-        with open('.autoflow/COMPLETED_TASKS.yml', 'w') as f:
-            yaml.dump(completed_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
-        print("   ✅ COMPLETED_TASKS.yml created successfully\n")
+        return future.result()
     except Exception as e:
-        print(f"   ❌ Error: {e}\n")
+        return f"   ❌ Error: {e}\n"
+
+def _run_migrations(jobs):
+    """Run migration jobs and return their status lines keyed by name.
+
+    The jobs share no state, so large inputs are parsed in worker processes;
+    small ones run in-process, where the pool would only add start-up time.
+    """
+    if sum(_source_size(job[0]) for job in jobs) < _PARALLEL_MIN_BYTES:
+        return {job[0]: _migrate(*job) for job in jobs}
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {job[0]: executor.submit(_migrate, *job) for job in jobs}
+        return {name: _result(future) for name, future in futures.items()}
+
+def main():
+    """Main migration function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--force', action='store_true', help='re-migrate even when the outputs are newer than their Markdown source')
+    parser.add_argument('--json', action='store_true', help='also write a .json copy of each YAML file')
+    args = parser.parse_args()
+
+    print("🔄 Migrating auto-flow files from Markdown to YAML...\n")
+
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    timestamp = now.isoformat() + 'Z'
+
+    migrations = (
+        ('SPRINTS', parse_sprints_md, today),
+        ('TASK', parse_task_md, timestamp),
+        ('COMPLETED_TASKS', parse_completed_tasks_md, timestamp),
+    )
+    jobs = []
+    for name, parse, last_updated in migrations:
+        targets = [f'.autoflow/{output}' for output in _outputs(name, args.json)]
+        if args.force or not _up_to_date(f'.autoflow/{name}.md', targets):
+            jobs.append((name, parse, last_updated, args.json))
+    results = _run_migrations(jobs)
+
+    # Report in a fixed order
+    for number, (name, _, _) in enumerate(migrations, 1):
+        outputs = ', '.join(_outputs(name, args.json))
+        print(f"{number}. Migrating {name}.md to {outputs}...")
+        print(results.get(name, f"   ✅ {outputs} up to date, skipped\n"))
 
     print("✨ Migration complete!")
     print("\nNext steps:")